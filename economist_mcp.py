@@ -1,8 +1,16 @@
 from fastmcp import FastMCP
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import os
+import asyncio
+import functools
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import httpx
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
 # Initialize the MCP Server
 mcp = FastMCP("The Economist Agent")
@@ -11,62 +19,233 @@ load_dotenv()
 # Configuration
 BASE_URL = "https://www.economist.com"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
 
-def fetch_content(url: str) -> str:
+# The plain HTTP probe gives up quickly so a stalled request doesn't delay the browser fallback
+HTTP_PROBE_TIMEOUT = 5.0 # seconds
+CHALLENGE_MARKERS = (b"Just a moment", b"Enable JavaScript")
+
+# Returned when an article page yields no usable body text
+INSUFFICIENT_TEXT_ERROR = "Error: Could not extract sufficient text. Check cookie validity or paywall status."
+
+# Recently read articles are kept in memory, keyed by URL
+ARTICLE_CACHE_SIZE = 128
+ARTICLE_CACHE_TTL = 30 * 60 # seconds
+
+# Selectors for The Economist's page structure
+ARTICLE_SELECTOR = 'article[data-testid="Article"]'
+# Wrapped in :is() so Lexbor returns an element once even when it matches several clauses
+BRIEFING_SELECTOR = ':is(p[data-component="the-world-in-brief-paragraph"], .css-p09rkj.e1pqka930, p[data-component="paragraph"])'
+TITLE_SELECTOR = '.css-1tik00t.e1qjd5lc0'
+SUBHEADING_SELECTOR = '.css-1fxcbca.e6h2z500'
+PARAGRAPH_SELECTOR = 'p[data-component="paragraph"]'
+CONTENT_READY_SELECTOR = "article, footer, [data-testid='Article']"
+IS_ARTICLE_JS = """el => el.matches("article, [data-testid='Article']")"""
+ARTICLE_HTML_JS = """document.querySelector('article[data-testid="Article"]')?.outerHTML"""
+PARAGRAPHS_READY_JS = """document.querySelectorAll('p[data-component="paragraph"], p[data-component="the-world-in-brief-paragraph"]').length > 3"""
+
+# Shared browser state. One async Playwright browser runs on a dedicated
+# event-loop thread; callers on other threads submit page loads to it, so
+# pages from concurrent tool calls load in parallel on the same context.
+_browser_loop = None
+_browser_thread = None
+_browser_lock = threading.Lock()
+_playwright = None
+_browser = None
+_context = None
+_context_lock = asyncio.Lock()
+
+# Article cache state: url -> (stored_at, full_text), least recently used first
+_article_cache = OrderedDict()
+_article_cache_lock = threading.Lock()
+
+@functools.cache
+def _parse_cookie_env() -> tuple[dict, ...]:
     """
-    Fetches content using Playwright to bypass Cloudflare.
+    Parses ECONOMIST_COOKIE into Playwright cookie dicts.
+    The result is cached; the environment is read once per process.
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent=USER_AGENT,
-            viewport={'width': 1280, 'height': 800}
-        )
-        
-        # Add cookie if available
-        cookie_str = os.getenv("ECONOMIST_COOKIE")
-        if cookie_str:
-            domain = ".economist.com"
-            cookies = []
-            for item in cookie_str.split(';'):
-                if '=' in item:
-                    try:
-                        name, value = item.strip().split('=', 1)
-                        cookies.append({
-                            "name": name,
-                            "value": value,
-                            "domain": domain,
-                            "path": "/"
-                        })
-                    except ValueError:
-                        continue
+    cookie_str = os.getenv("ECONOMIST_COOKIE")
+    cookies = []
+    if cookie_str:
+        domain = ".economist.com"
+        for item in cookie_str.split(';'):
+            if '=' in item:
+                try:
+                    name, value = item.strip().split('=', 1)
+                    cookies.append({
+                        "name": name,
+                        "value": value,
+                        "domain": domain,
+                        "path": "/"
+                    })
+                except ValueError:
+                    continue
+    return tuple(cookies)
+
+def _make_http_client() -> httpx.Client:
+    """
+    Builds the pooled HTTP client used for the browserless fast path.
+    """
+    cookies = httpx.Cookies()
+    for cookie in _parse_cookie_env():
+        cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+    # Keep connections to www.economist.com alive between tool calls so warm
+    # requests skip the TCP and TLS handshakes
+    return httpx.Client(
+        http2=True,
+        headers=HEADERS,
+        cookies=cookies,
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=120),
+    )
+
+_http_client = _make_http_client()
+
+# Bounded pool for batch reads over the shared client, to respect economist.com rate limits
+_http_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="http-fetch")
+
+def _try_http_fetch(url: str) -> bytes | None:
+    """
+    Fetches a page over plain HTTP, skipping the browser.
+    Returns None when the response is not a usable article page (e.g. a Cloudflare challenge).
+    """
+    try:
+        response = _http_client.get(url, timeout=HTTP_PROBE_TIMEOUT)
+    except httpx.HTTPError:
+        return None
+    
+    html_content = response.content
+    if response.status_code != 200 or b'data-testid="Article"' not in html_content:
+        return None
+    if any(marker in html_content for marker in CHALLENGE_MARKERS):
+        return None
+    return html_content
+
+async def _get_context():
+    """
+    Returns the shared browser context, launching the browser on first use
+    and relaunching it if it has disconnected. Runs on the browser loop.
+    """
+    global _playwright, _browser, _context
+    async with _context_lock:
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        if _browser is None or not _browser.is_connected():
+            _browser = await _playwright.chromium.launch(headless=True)
+            _context = None
+        if _context is None:
+            context = await _browser.new_context(
+                user_agent=USER_AGENT,
+                viewport={'width': 1280, 'height': 800}
+            )
+            # Add cookie if available
+            cookies = _parse_cookie_env()
             if cookies:
-                context.add_cookies(cookies)
+                await context.add_cookies(cookies)
+            _context = context
+    return _context
 
-        page = context.new_page()
+async def _load_page(url: str) -> bytes:
+    """
+    Loads a URL in a fresh page of the shared context and returns its HTML.
+    Runs on the browser loop.
+    """
+    context = await _get_context()
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        
+        # Wait for Cloudflare challenge to resolve or content to appear
+        article_ready = False
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            # Wait for main article content or footer, timeout after 30s
+            matched = await page.wait_for_selector(CONTENT_READY_SELECTOR, timeout=30000)
+            article_ready = await matched.evaluate(IS_ARTICLE_JS)
+        except:
+            pass # Proceed anyway
+        
+        # Sometimes scrolling down triggers lazy loading or helps pass bot checks.
+        # Skipped when the article itself has already rendered.
+        if not article_ready:
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             
-            # Wait for Cloudflare challenge to resolve or content to appear
+            # Wait until paragraphs have rendered instead of sleeping a fixed delay
             try:
-                # Wait for main article content or footer, timeout after 30s
-                page.wait_for_selector("article, footer, [data-testid='Article']", timeout=30000)
+                await page.wait_for_function(PARAGRAPHS_READY_JS, timeout=3000)
             except:
-                pass # Proceed anyway
-            
-            # Sometimes scrolling down triggers lazy loading or helps pass bot checks
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000) # Small delay
-            
-            content = page.content()
-        except Exception as e:
-            print(f"Error fetching {url}: {e}")
-            content = ""
-        finally:
-            browser.close()
-            
+                pass # Proceed with whatever has loaded
+        
+        # Serialize only the article subtree; fall back to the full page when absent.
+        # Encoded once here so the parser takes bytes without another copy.
+        content = (await page.evaluate(ARTICLE_HTML_JS) or await page.content()).encode("utf-8", "replace")
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        content = b""
+    finally:
+        await page.close()
+        
     return content
 
+def _get_browser_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop that owns the shared browser, starting its thread on first use.
+    """
+    global _browser_loop, _browser_thread
+    with _browser_lock:
+        if _browser_loop is None:
+            _browser_loop = asyncio.new_event_loop()
+            _browser_thread = threading.Thread(target=_browser_loop.run_forever, name="playwright-browser", daemon=True)
+            _browser_thread.start()
+    return _browser_loop
+
+def _submit_page_load(url: str) -> Future:
+    """
+    Schedules a page load on the browser loop and returns its future.
+    """
+    return asyncio.run_coroutine_threadsafe(_load_page(url), _get_browser_loop())
+
+async def _shutdown_browser():
+    """
+    Closes the shared browser and stops Playwright. Runs on the browser loop.
+    """
+    if _browser is not None and _browser.is_connected():
+        await _browser.close()
+    if _playwright is not None:
+        await _playwright.stop()
+
+def _close_browser():
+    """
+    Closes the shared browser and stops its event loop on interpreter exit.
+    """
+    if _browser_loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_shutdown_browser(), _browser_loop).result(timeout=10)
+    except Exception:
+        pass # The driver exits with the process anyway
+    finally:
+        _browser_loop.call_soon_threadsafe(_browser_loop.stop)
+        _browser_thread.join(timeout=10)
+
+atexit.register(_close_browser)
+
+def fetch_content(url: str) -> bytes:
+    """
+    Fetches content over plain HTTP, falling back to Playwright to bypass Cloudflare.
+    Reuses a shared browser; each call gets its own page, and concurrent calls load in parallel.
+    """
+    html_content = _try_http_fetch(url)
+    if html_content is not None:
+        return html_content
+    
+    return _submit_page_load(url).result()
+
 def _get_latest_briefing_logic() -> str:
     """
     Internal logic for fetching the briefing.
@@ -77,36 +256,35 @@ def _get_latest_briefing_logic() -> str:
     if not html_content:
         return "Error: Failed to fetch content. Cloudflare might be blocking or network issue."
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
     
     # Scope to the article container
-    article = soup.select_one('article[data-testid="Article"]')
-    container = article if article else soup
+    article = tree.css_first(ARTICLE_SELECTOR)
+    container = article if article else tree
     
     content_parts = []
     
     # Select all relevant elements in order of appearance
-    selector = 'p[data-component="the-world-in-brief-paragraph"], .css-p09rkj.e1pqka930, p[data-component="paragraph"]'
-    elements = container.select(selector)
+    elements = container.css(BRIEFING_SELECTOR)
     
     if not elements:
-        # Check for Cloudflare specific text
-        text = soup.get_text()
-        if "Just a moment" in text or "Enable JavaScript" in text:
+        # Check the raw HTML for Cloudflare specific text
+        if any(marker in html_content for marker in CHALLENGE_MARKERS):
              return "Error: Still blocked by Cloudflare challenge. Please try updating cookies."
         return "Error: Could not find briefing content. Structure might have changed."
 
     for elem in elements:
-        text = elem.get_text(separator=' ', strip=True)
+        text = elem.text(separator=' ', strip=True, skip_empty=True)
         if not text:
             continue
             
         # Identify element type based on attributes/classes
-        if elem.name == 'p' and elem.get('data-component') == 'the-world-in-brief-paragraph':
+        attrs = elem.attributes
+        if elem.tag == 'p' and attrs.get('data-component') == 'the-world-in-brief-paragraph':
             content_parts.append(text)
-        elif 'css-p09rkj' in elem.get('class', []): # Title
+        elif 'css-p09rkj' in (attrs.get('class') or '').split(): # Title
              content_parts.append(f"\n## {text}")
-        elif elem.name == 'p' and elem.get('data-component') == 'paragraph':
+        elif elem.tag == 'p' and attrs.get('data-component') == 'paragraph':
             content_parts.append(text)
             
     full_text = "\n\n".join(content_parts)
@@ -116,34 +294,31 @@ def _get_latest_briefing_logic() -> str:
         
     return full_text
 
-def _read_full_article_logic(url: str) -> str:
+def _extract_article(html_content: bytes) -> str:
     """
-    Internal logic for reading an article.
+    Extracts the title, subheading and body text from an article page's HTML.
     """
-    html_content = fetch_content(url)
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
     
     # Scope to the article container
-    article = soup.select_one('article[data-testid="Article"]')
+    article = tree.css_first(ARTICLE_SELECTOR)
     if not article:
-        if "Just a moment" in soup.get_text():
+        if b"Just a moment" in html_content:
              return "Error: Blocked by Cloudflare challenge."
         return "Error: Could not find article container. Check URL or cookie validity."
     
+    # Extract paragraphs using data-component attribute
+    paragraphs = [text for p in article.css(PARAGRAPH_SELECTOR) if (text := p.text(separator=' ', strip=True, skip_empty=True))]
+    if not paragraphs:
+        return INSUFFICIENT_TEXT_ERROR
+    
     # Extract title
-    title_elem = article.select_one('.css-1tik00t.e1qjd5lc0')
-    title = title_elem.get_text(strip=True) if title_elem else "Title not found"
+    title_elem = article.css_first(TITLE_SELECTOR)
+    title = title_elem.text(strip=True) if title_elem else "Title not found"
     
     # Extract subheading (if present)
-    subheading_elem = article.select_one('.css-1fxcbca.e6h2z500')
-    subheading = subheading_elem.get_text(strip=True) if subheading_elem else None
-    
-    # Extract paragraphs using data-component attribute
-    paragraphs = []
-    for p in article.select('p[data-component="paragraph"]'):
-        text = p.get_text(separator=' ', strip=True)
-        if text:
-            paragraphs.append(text)
+    subheading_elem = article.css_first(SUBHEADING_SELECTOR)
+    subheading = subheading_elem.text(strip=True) if subheading_elem else None
     
     # Build the full article text
     article_parts = [f"Title: {title}"]
@@ -155,11 +330,80 @@ def _read_full_article_logic(url: str) -> str:
     
     full_text = "\n".join(article_parts)
     
-    if len(paragraphs) == 0 or len(full_text) < 100:
-        return "Error: Could not extract sufficient text. Check cookie validity or paywall status."
+    if len(full_text) < 100:
+        return INSUFFICIENT_TEXT_ERROR
         
     return full_text
 
+def _get_cached_article(url: str) -> str | None:
+    """
+    Returns the cached text for a recently read article, or None if absent or expired.
+    """
+    with _article_cache_lock:
+        entry = _article_cache.get(url)
+        if entry is None:
+            return None
+        stored_at, full_text = entry
+        if time.monotonic() - stored_at > ARTICLE_CACHE_TTL:
+            del _article_cache[url]
+            return None
+        _article_cache.move_to_end(url)
+        return full_text
+
+def _cache_article(url: str, full_text: str):
+    """
+    Stores a successfully extracted article, evicting the least recently used entry when full.
+    Errors are not cached so transient failures can be retried.
+    """
+    if full_text.startswith("Error:"):
+        return
+    with _article_cache_lock:
+        _article_cache[url] = (time.monotonic(), full_text)
+        _article_cache.move_to_end(url)
+        while len(_article_cache) > ARTICLE_CACHE_SIZE:
+            _article_cache.popitem(last=False)
+
+def _read_full_article_logic(url: str) -> str:
+    """
+    Internal logic for reading an article.
+    """
+    cached = _get_cached_article(url)
+    if cached is not None:
+        return cached
+    
+    full_text = _extract_article(fetch_content(url))
+    _cache_article(url, full_text)
+    return full_text
+
+async def _read_batch(urls: list[str], max_concurrency: int = 5) -> dict:
+    """
+    Internal logic for reading several articles concurrently.
+    Each URL is tried over plain HTTP first; only the misses open a page in the
+    shared browser, with at most max_concurrency of this batch's pages open at once.
+    """
+    urls = list(dict.fromkeys(urls))
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max_concurrency)
+    
+    async def read_one(url: str) -> str:
+        cached = _get_cached_article(url)
+        if cached is not None:
+            return cached
+        
+        html_content = await loop.run_in_executor(_http_executor, _try_http_fetch, url)
+        if html_content is None:
+            async with sem:
+                html_content = await asyncio.wrap_future(_submit_page_load(url))
+        full_text = _extract_article(html_content)
+        _cache_article(url, full_text)
+        return full_text
+    
+    results = await asyncio.gather(*(read_one(url) for url in urls), return_exceptions=True)
+    return {
+        url: f"Error: {result}" if isinstance(result, Exception) else result
+        for url, result in zip(urls, results)
+    }
+
 @mcp.tool()
 def get_latest_briefing() -> str:
     """
@@ -177,6 +421,15 @@ def read_full_article(url: str) -> str:
     """
     return _read_full_article_logic(url)
 
+@mcp.tool()
+async def read_articles_batch(urls: list[str]) -> dict:
+    """
+    Fetches the full text of several Economist article URLs concurrently.
+    Use this instead of repeated read_full_article calls when reading multiple headlines.
+    Returns a mapping of each URL to its article text or error message.
+    """
+    return await _read_batch(urls)
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1 and sys.argv[1] == "test":
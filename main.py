@@ -1,5 +1,8 @@
+from economist_mcp import mcp
+
+
 def main():
-    print("Hello from the-economist-poke-mcp!")
+    mcp.run()
 
 
 if __name__ == "__main__":